@@ -1,10 +1,48 @@
 from google.oauth2 import service_account
+from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
+from googleapiclient.errors import HttpError
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import time
+import random
+import hashlib
+import queue
+import shutil
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
 from tqdm import tqdm
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+from contextlib import contextmanager
+
+try:
+    # Optional: HTTP/2 downloads need both httpx and h2 (pip install httpx[http2])
+    import httpx
+    import h2  # noqa: F401
+except ImportError:
+    httpx = None
+
+try:
+    # Optional: faster JSON decoding for file listings (pip install orjson)
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # Optional: needed only for the async download methods (pip install aiohttp)
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Responses retried with backoff on both the requests and httpx download paths
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
 
 class GoogleDriveClient:
     """
@@ -15,64 +53,285 @@ class GoogleDriveClient:
       client = GoogleDriveClient("path/to/credentials.json")
 
       iter = client.iter_images("folder_id")
+
+    * credentials_path: The path to the service account credentials json file.
+    * download_concurrency: The default number of concurrent downloads, also used to size the connection pool.
+    * use_http2: Whether to download over HTTP/2 when httpx and h2 are installed. Ignored when session is given.
+    * session: Optional requests session to use for all listing and download requests instead of the client's own pooled session.
     """
-    def __init__(self, credentials_path: str):
+    def __init__(self, credentials_path: str, download_concurrency: int = 64, use_http2: bool = True, session: requests.Session | None = None):
         self.credentials = service_account.Credentials.from_service_account_file(
             credentials_path, scopes=["https://www.googleapis.com/auth/drive"]
         )
-        self.service = build("drive", "v3", credentials=self.credentials)
+        self._download_concurrency = download_concurrency
+        self._session = session
+        if self._session is None:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=max(64, download_concurrency),
+                max_retries=Retry(total=5, backoff_factor=0.3, status_forcelist=list(_RETRY_STATUSES))
+            )
+            self._session.mount("https://", adapter)
+        # (connect, read) timeouts so a stalled connection cannot hang a worker forever
+        self._timeout = (10, 60)
+        self._auth_lock = threading.Lock()
+        self._local = threading.local()
+        self._httpx = None
+        # A caller-provided session carries its own proxies, CA settings and adapters, so downloads must go through it too
+        if use_http2 and httpx is not None and session is None:
+            self._httpx = httpx.Client(
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+                    retries=5
+                ),
+                timeout=30.0
+            )
     
-    def list_files(self, folder_id: str, page_size: int = 100):
+    def _bearer(self) -> str:
         """
-        List all files in the specified folder.
+        Returns the Authorization header value, refreshing the access token only when it is missing or about to expire.
+        """
+        with self._auth_lock:
+            # google-auth stores expiry as a naive UTC datetime
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            expiry = self.credentials.expiry
+            # credentials.valid also applies google-auth's own refresh threshold, which AuthorizedHttp checks
+            if not self.credentials.valid or expiry is None or expiry <= now + timedelta(seconds=60):
+                self.credentials.refresh(Request(self._session))
+            return f"Bearer {self.credentials.token}"
+    def _http(self) -> AuthorizedHttp:
+        """
+        Returns an authorized httplib2 transport for the current thread, since httplib2.Http is not thread-safe.
+        """
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
+    def _svc(self):
+        """
+        Returns a Drive service for the current thread, built lazily on top of that thread's transport.
+
+        The token is refreshed here under the auth lock, so the per-thread AuthorizedHttp never has to refresh the shared credentials itself.
+        """
+        self._bearer()
+        service = getattr(self._local, "service", None)
+        if service is None:
+            service = build("drive", "v3", http=self._http(), cache_discovery=False)
+            self._local.service = service
+        return service
+    @property
+    def service(self):
+        """
+        The Drive service for the calling thread.
+        """
+        return self._svc()
+    def _warm_up(self):
+        """
+        Opens a connection to the Drive API ahead of a download burst, so workers reuse it instead of all handshaking at once.
+        """
+        headers = {"Authorization": self._bearer()}
+        url = "https://www.googleapis.com/drive/v3/about?fields=user"
+        try:
+            if self._httpx is not None:
+                self._httpx.get(url, headers=headers)
+            else:
+                self._session.get(url, headers=headers, timeout=self._timeout).close()
+        except Exception:
+            # Warming up is best effort; the downloads themselves report real errors
+            pass
+    def list_files_pages(self, folder_id: str, page_size: int = 1000):
+        """
+        List all files in the specified folder, one page at a time.
 
         * folder_id: The ID of the Google Drive folder to iterate through.
-        * page_size: The number of files to fetch per page.
+        * page_size: The number of files to fetch per page (at most 1000).
+
+        Yields a tuple of file dicts per page.
         """
-        query = f"'{folder_id}' in parents and trashed=false"
-        page_token = None
+        # Listing calls the REST endpoint directly on the pooled session, skipping googleapiclient's overhead
+        params = {
+            "q": f"'{folder_id}' in parents and trashed=false",
+            "fields": "nextPageToken, files(id, name, size, md5Checksum, modifiedTime)",
+            "pageSize": page_size,
+            "supportsAllDrives": "true",
+            "includeItemsFromAllDrives": "true"
+        }
         
         while True:
-            response = self.service.files().list(
-                q=query,
-                fields="nextPageToken, files(id, name)",
-                pageSize=page_size,
-                pageToken=page_token
-            ).execute()
+            response = self._session.get(
+                "https://www.googleapis.com/drive/v3/files",
+                params=params,
+                headers={"Authorization": self._bearer()},
+                timeout=self._timeout
+            )
+            if response.status_code != 200:
+                raise Exception(f"Failed to list files: {response.status_code} - {response.text}")
+            data = json_loads(response.content)
             
-            for file in response.get("files", []):
-                yield file
+            yield tuple(data.get("files", []))
             
-            page_token = response.get("nextPageToken")
+            page_token = data.get("nextPageToken")
             if not page_token:
                 break
-    def download_file(self, file_id: str, destination: str | None = None, verbose: bool = False):
+            params["pageToken"] = page_token
+    def list_files(self, folder_id: str, page_size: int = 1000):
+        """
+        List all files in the specified folder.
+
+        * folder_id: The ID of the Google Drive folder to iterate through.
+        * page_size: The number of files to fetch per page (at most 1000).
+        """
+        for page in self.list_files_pages(folder_id, page_size):
+            yield from page
+    def download_file(self, file_id: str, destination: str | None = None, verbose: bool = False, offset: int = 0):
         """
         Downloads a file from Google Drive using service account authentication.
 
         * file_id: The ID of the file to download.
-        * destination: The path to save the file to. If None, the file will be yielded.
+        * destination: The path to save the file to. If None, the file content is returned as bytes.
         * verbose: Whether to print download status messages.
+        * offset: Resume a partial download by appending to destination from this byte offset.
         """
-        headers = {"Authorization": f"Bearer {self.credentials.token}"}
+        headers = {"Authorization": self._bearer(), "Accept-Encoding": "identity"}
+        if offset and destination is not None:
+            headers["Range"] = f"bytes={offset}-"
         url = f"https://www.googleapis.com/drive/v3/files/{file_id}?alt=media"
-        response = requests.get(url, headers=headers, stream=True)
+        if self._httpx is not None:
+            return self._download_file_http2(url, headers, file_id, destination, verbose)
+        response = self._session.get(url, headers=headers, stream=True, timeout=self._timeout)
         
-        if response.status_code == 200:
+        if response.status_code in (200, 206):
             if destination is None:
-                return response.content
+                return self._read_content(response)
             else:
-                with open(destination, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=1024):
-                        if chunk:
-                            f.write(chunk)
+                # 206 means the server honoured the Range header, so append to the partial file
+                mode = "ab" if response.status_code == 206 else "wb"
+                # Copy the body as-is unless the server compressed it despite Accept-Encoding: identity
+                response.raw.decode_content = bool(response.headers.get("Content-Encoding"))
+                with open(destination, mode, buffering=1024 * 1024) as f:
+                    shutil.copyfileobj(response.raw, f, length=1024 * 1024)
                 if verbose:
                     tqdm.write(f"File downloaded: {file_id} -> {destination}")
         else:
             error_msg = f"Failed to download file: {response.status_code} - {response.text}"
-            tqdm.write(error_msg)
+            if verbose:
+                tqdm.write(error_msg)
             raise Exception(error_msg)
-    def iter_images(self, folder_id: str, page_size: int = 100):
+    def download_file_parallel(self, file_id: str, destination: str, part_size: int = 16 * 1024 * 1024, parts: int = 8, threshold: int = 32 * 1024 * 1024, verbose: bool = False):
+        """
+        Downloads a large file as several byte ranges over parallel connections, writing each range in place.
+
+        * file_id: The ID of the file to download.
+        * destination: The path to save the file to.
+        * part_size: The number of bytes fetched per range request.
+        * parts: The number of ranges downloaded concurrently.
+        * threshold: Files up to this size are downloaded with a single request via download_file.
+        * verbose: Whether to print download status messages.
+        """
+        metadata = self._svc().files().get(fileId=file_id, fields="size", supportsAllDrives=True).execute()
+        size = int(metadata.get("size", 0))
+        if size <= threshold or not hasattr(os, "pwrite"):
+            return self.download_file(file_id, destination, verbose)
+        url = f"https://www.googleapis.com/drive/v3/files/{file_id}?alt=media"
+        # Write to a temporary file so a failed download never leaves a full-size file with holes at destination
+        part_path = destination + ".part"
+        fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            try:
+                os.posix_fallocate(fd, 0, size)
+            except (AttributeError, OSError):
+                os.ftruncate(fd, size)
+            def download_part(start: int):
+                end = min(start + part_size, size) - 1
+                headers = {"Authorization": self._bearer(), "Accept-Encoding": "identity", "Range": f"bytes={start}-{end}"}
+                with self._session.get(url, headers=headers, stream=True, timeout=self._timeout) as response:
+                    if response.status_code != 206:
+                        error_msg = f"Failed to download file range {start}-{end}: {response.status_code} - {response.text}"
+                        if verbose:
+                            tqdm.write(error_msg)
+                        raise Exception(error_msg)
+                    offset = start
+                    while chunk := response.raw.read(1024 * 1024):
+                        view = memoryview(chunk)
+                        while view:
+                            written = os.pwrite(fd, view, offset)
+                            offset += written
+                            view = view[written:]
+                    if offset != end + 1:
+                        raise Exception(f"Failed to download file range {start}-{end}: received {offset - start} bytes")
+            with ThreadPoolExecutor(max_workers=parts) as executor:
+                list(executor.map(download_part, range(0, size, part_size)))
+        except BaseException:
+            os.close(fd)
+            os.unlink(part_path)
+            raise
+        os.close(fd)
+        os.replace(part_path, destination)
+        if verbose:
+            tqdm.write(f"File downloaded: {file_id} -> {destination}")
+    @contextmanager
+    def _http2_stream(self, url: str, headers: dict):
+        """
+        Opens an httpx GET stream, retrying 429/5xx responses with the same backoff as the requests session.
+        """
+        retries = 5
+        for attempt in range(retries + 1):
+            with self._httpx.stream("GET", url, headers=headers) as response:
+                if response.status_code not in _RETRY_STATUSES or attempt == retries:
+                    yield response
+                    return
+            time.sleep(0.3 * 2 ** attempt)
+    def _download_file_http2(self, url: str, headers: dict, file_id: str, destination: str | None, verbose: bool):
+        """
+        HTTP/2 variant of download_file, multiplexing concurrent downloads over a few shared connections.
+        """
+        with self._http2_stream(url, headers) as response:
+            if response.status_code not in (200, 206):
+                response.read()
+                error_msg = f"Failed to download file: {response.status_code} - {response.text}"
+                if verbose:
+                    tqdm.write(error_msg)
+                raise Exception(error_msg)
+            if destination is None:
+                return response.read()
+            mode = "ab" if response.status_code == 206 else "wb"
+            chunks = response.iter_bytes if response.headers.get("Content-Encoding") else response.iter_raw
+            with open(destination, mode, buffering=1024 * 1024) as f:
+                for chunk in chunks(chunk_size=256 * 1024):
+                    f.write(chunk)
+        if verbose:
+            tqdm.write(f"File downloaded: {file_id} -> {destination}")
+    def _file_md5(self, path: str) -> str:
+        """
+        Computes the hex MD5 digest of a local file, for comparison with Drive's md5Checksum.
+        """
+        md5 = hashlib.md5()
+        with open(path, "rb") as f:
+            while chunk := f.read(1024 * 1024):
+                md5.update(chunk)
+        return md5.hexdigest()
+    def _parse_time(self, timestamp: str) -> float:
+        """
+        Converts a Drive RFC 3339 timestamp (e.g. 2024-01-01T12:00:00.000Z) to a POSIX timestamp.
+        """
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    def _read_content(self, response: requests.Response) -> bytes:
+        """
+        Reads a streamed response body in a single read, without the chunk joining done by response.content.
+
+        Falls back to response.content when the body is encoded and has to be decoded.
+        """
+        try:
+            if response.headers.get("Content-Encoding"):
+                return response.content
+            return response.raw.read(decode_content=False)
+        finally:
+            # Hand the connection back to the pool even if the body was not read to the end
+            response.close()
+    def iter_images(self, folder_id: str, page_size: int = 1000):
         """
         Iterates through all images in the specified folder.
 
@@ -81,7 +340,38 @@ class GoogleDriveClient:
         """
         for file in self.list_files(folder_id, page_size):
             yield self.download_file(file["id"])
-    def download_images(self, folder_id: str, destination_folder_path: str, page_size: int = 100, verbose: bool = False, show_tqdm: bool = True):
+    def stream_file(self, file_id: str, chunk_size: int = 256 * 1024) -> Iterator[bytes]:
+        """
+        Streams a file from Google Drive chunk by chunk, without holding the whole file in memory.
+
+        * file_id: The ID of the file to stream.
+        * chunk_size: The number of bytes to read per chunk.
+        """
+        headers = {"Authorization": self._bearer(), "Accept-Encoding": "identity"}
+        url = f"https://www.googleapis.com/drive/v3/files/{file_id}?alt=media"
+        if self._httpx is not None:
+            with self._http2_stream(url, headers) as response:
+                if response.status_code != 200:
+                    response.read()
+                    error_msg = f"Failed to download file: {response.status_code} - {response.text}"
+                    raise Exception(error_msg)
+                yield from response.iter_bytes(chunk_size=chunk_size)
+            return
+        with self._session.get(url, headers=headers, stream=True, timeout=self._timeout) as response:
+            if response.status_code != 200:
+                error_msg = f"Failed to download file: {response.status_code} - {response.text}"
+                raise Exception(error_msg)
+            yield from response.iter_content(chunk_size=chunk_size)
+    def iter_image_streams(self, folder_id: str, page_size: int = 1000):
+        """
+        Iterates through all images in the specified folder, yielding a chunk iterator per image (see stream_file).
+
+        * folder_id: The ID of the Google Drive folder to iterate through.
+        * page_size: The number of files to fetch per page.
+        """
+        for file in self.list_files(folder_id, page_size):
+            yield self.stream_file(file["id"])
+    def download_images(self, folder_id: str, destination_folder_path: str, page_size: int = 1000, verbose: bool = False, show_tqdm: bool = True, max_workers: int | None = None, group_by_id: bool = True, skip_existing: bool = True, verify_md5: bool = False):
         """
         Downloads all images in the specified folder to a local directory.
 
@@ -90,22 +380,138 @@ class GoogleDriveClient:
         * page_size: The number of files to fetch per page.
         * verbose: Whether to print download status messages.
         * show_tqdm: Whether to display a progress bar.
+        * max_workers: The number of concurrent downloads. If None, uses the client's download_concurrency.
+        * group_by_id: Whether to dispatch each listed page in file ID order, so files with the same ID prefix are fetched together.
+        * skip_existing: Whether to skip files already present locally with the same size and modification time, and resume partial downloads that can be checked against Drive's MD5 checksum.
+        * verify_md5: Whether to also compare the MD5 checksum of existing files before skipping them.
         """
+        if max_workers is None:
+            max_workers = self._download_concurrency
         os.makedirs(destination_folder_path, exist_ok=True)
-        def download_task(file_id: str, file_name: str):
-            self.download_file(file_id, os.path.join(destination_folder_path, file_name), verbose)
-        files: list[tuple[str, str]] = []
-        for file in self.list_files(folder_id, page_size):
-            files.append((str(file["id"]), str(file["name"])))
-        if show_tqdm:
-            with ThreadPoolExecutor() as executor, tqdm(total=len(files), desc=f"Downloading: {folder_id} -> {destination_folder_path}", ncols=100) as pbar:
-                futures = {executor.submit(download_task, file_id, file_name) for file_id, file_name in files}
-                for future in as_completed(futures):
-                    future.result()
+        semaphore = threading.Semaphore(max_workers)
+        def download_task(file_id: str, file_name: str, size: int | None, md5: str | None, modified: float | None):
+            destination = os.path.join(destination_folder_path, file_name)
+            offset = 0
+            if skip_existing and size is not None and os.path.exists(destination):
+                local = os.stat(destination)
+                if (
+                    local.st_size == size
+                    and modified is not None
+                    and abs(local.st_mtime - modified) < 1
+                    and (not verify_md5 or md5 is None or self._file_md5(destination) == md5)
+                ):
+                    if verbose:
+                        tqdm.write(f"File up to date: {file_id} -> {destination}")
+                    return
+                # Only resume when the result can be verified, since the partial file may be from an older revision
+                if 0 < local.st_size < size and md5 is not None:
+                    offset = local.st_size
+            with semaphore:
+                self.download_file(file_id, destination, verbose, offset=offset)
+                if offset and self._file_md5(destination) != md5:
+                    if verbose:
+                        tqdm.write(f"Resumed file failed MD5 check, downloading again: {file_id} -> {destination}")
+                    self.download_file(file_id, destination, verbose)
+            if modified is not None:
+                os.utime(destination, (modified, modified))
+        # List files in a background thread so downloads start as soon as the first page arrives
+        pages: queue.Queue[list[tuple[str, str, int | None, str | None, float | None]] | None] = queue.Queue(maxsize=4)
+        listing_errors: list[BaseException] = []
+        def list_task():
+            try:
+                for page in self.list_files_pages(folder_id, page_size):
+                    pages.put([
+                        (
+                            str(file["id"]),
+                            str(file["name"]),
+                            int(file["size"]) if "size" in file else None,
+                            file.get("md5Checksum"),
+                            self._parse_time(file["modifiedTime"]) if "modifiedTime" in file else None
+                        )
+                        for file in page
+                    ])
+            except BaseException as e:
+                listing_errors.append(e)
+            finally:
+                pages.put(None)
+        threading.Thread(target=list_task, daemon=True).start()
+        self._warm_up()
+        # Cap queued downloads so memory stays bounded on huge folders
+        in_flight = threading.Semaphore(4 * max_workers)
+        pbar_lock = threading.Lock()
+        download_errors: list[BaseException] = []
+        with tqdm(total=0, desc=f"Downloading: {folder_id} -> {destination_folder_path}", ncols=100, mininterval=0.2, disable=not show_tqdm) as pbar, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            def on_done(future):
+                in_flight.release()
+                if future.exception() is not None:
+                    download_errors.append(future.exception())
+                with pbar_lock:
                     pbar.update(1)
-        else:
-            with ThreadPoolExecutor() as executor:
-                executor.map(lambda args: download_task(*args), files)
+            while (page := pages.get()) is not None:
+                if group_by_id:
+                    page.sort()
+                with pbar_lock:
+                    pbar.total += len(page)
+                for file in page:
+                    in_flight.acquire()
+                    executor.submit(download_task, *file).add_done_callback(on_done)
+        if listing_errors:
+            raise listing_errors[0]
+        if download_errors:
+            raise download_errors[0]
+    async def adownload_file(self, session: "aiohttp.ClientSession", file_id: str, destination: str, verbose: bool = False):
+        """
+        Asynchronously downloads a file from Google Drive to a local path. Requires aiohttp.
+
+        * session: The aiohttp session to download with.
+        * file_id: The ID of the file to download.
+        * destination: The path to save the file to.
+        * verbose: Whether to print download status messages.
+        """
+        # A token refresh is a blocking HTTP call, so keep it off the event loop
+        headers = {"Authorization": await asyncio.to_thread(self._bearer), "Accept-Encoding": "identity"}
+        url = f"https://www.googleapis.com/drive/v3/files/{file_id}?alt=media"
+        async with session.get(url, headers=headers) as response:
+            if response.status != 200:
+                error_msg = f"Failed to download file: {response.status} - {await response.text()}"
+                if verbose:
+                    tqdm.write(error_msg)
+                raise Exception(error_msg)
+            with open(destination, "wb", buffering=1024 * 1024) as f:
+                async for chunk in response.content.iter_chunked(256 * 1024):
+                    f.write(chunk)
+        if verbose:
+            tqdm.write(f"File downloaded: {file_id} -> {destination}")
+    async def adownload_images(self, folder_id: str, destination_folder_path: str, page_size: int = 1000, verbose: bool = False, concurrency: int = 128):
+        """
+        Asynchronously downloads all images in the specified folder to a local directory. Requires aiohttp.
+
+        * folder_id: The ID of the Google Drive folder to download images from.
+        * destination_folder_path: The path to save the images to.
+        * page_size: The number of files to fetch per page.
+        * verbose: Whether to print download status messages.
+        * concurrency: The maximum number of downloads in flight.
+        """
+        if aiohttp is None:
+            raise ImportError("adownload_images requires aiohttp: pip install aiohttp")
+        os.makedirs(destination_folder_path, exist_ok=True)
+        files: list[tuple[str, str]] = await asyncio.to_thread(
+            lambda: [(str(file["id"]), str(file["name"])) for page in self.list_files_pages(folder_id, page_size) for file in page]
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+        connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=32, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def download_task(file_id: str, file_name: str):
+                async with semaphore:
+                    await self.adownload_file(session, file_id, os.path.join(destination_folder_path, file_name), verbose)
+            # The task group cancels the remaining downloads on the first failure, before the session closes
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for file_id, file_name in files:
+                        group.create_task(download_task(file_id, file_name))
+            except ExceptionGroup as e:
+                # Raise the first failure, like download_images does
+                raise e.exceptions[0] from e
     def upload_file(self, file_path: str, folder_id: str, file_name: str | None = None, verbose: bool = False):
         """
         Uploads a file to Google Drive using service account authentication.
@@ -123,13 +529,15 @@ class GoogleDriveClient:
             'parents': [folder_id]
         }
 
+        # Small files go up in a single multipart request; only large ones use a resumable session
         media = MediaFileUpload(
             file_path,
-            resumable=True
+            resumable=os.path.getsize(file_path) > 5 * 1024 * 1024,
+            chunksize=16 * 1024 * 1024
         )
 
         try:
-            file = self.service.files().create(
+            file = self._svc().files().create(
                 body=file_metadata,
                 media_body=media,
                 fields='id'
@@ -141,6 +549,39 @@ class GoogleDriveClient:
             if verbose:
                 tqdm.write(f"An error occurred while uploading the file: {e}")
             return None
+    def bulk_upload(self, file_paths: list[str], folder_id: str, max_workers: int = 16, verbose: bool = False):
+        """
+        Uploads multiple files to Google Drive concurrently.
+
+        * file_paths: The paths to the files to upload.
+        * folder_id: The ID of the folder to upload the files to.
+        * max_workers: The number of concurrent uploads.
+        * verbose: Whether to print upload status messages.
+
+        Returns the uploaded file IDs in the same order as file_paths (None for failed uploads).
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda file_path: self.upload_file(file_path, folder_id, verbose=verbose), file_paths))
+    def _is_retryable(self, exception: Exception) -> bool:
+        """
+        Whether a failed API call is worth retrying: rate limits (429, 403 rate limit reasons) and server errors.
+        """
+        if not isinstance(exception, HttpError):
+            return False
+        status = exception.resp.status
+        if status == 429 or status >= 500:
+            return True
+        if status == 403:
+            try:
+                error = json_loads(exception.content)["error"]
+                details = list(error.get("errors", [])) + list(error.get("details", []))
+            except (ValueError, KeyError, TypeError, AttributeError):
+                return False
+            return any(
+                isinstance(detail, dict) and detail.get("reason") in ("rateLimitExceeded", "userRateLimitExceeded")
+                for detail in details
+            )
+        return False
     def delete_folder_contents(self, folder_id: str, verbose: bool = False):
         """
         Deletes all files within a specified folder but keeps the folder itself.
@@ -150,17 +591,37 @@ class GoogleDriveClient:
         """
         try:
             # List all files in the folder
-            files = self.list_files(folder_id)
-            
-            # Delete each file
-            for file in files:
-                try:
-                    self.service.files().delete(fileId=file['id']).execute()
-                    if verbose:
-                        tqdm.write(f"Deleted file: {file['name']}")
-                except Exception as e:
-                    if verbose:
-                        tqdm.write(f"Error deleting file {file['name']}: {e}")
+            files = {file['id']: file['name'] for page in self.list_files_pages(folder_id) for file in page}
+            failed: dict[str, Exception] = {}
+
+            def callback(request_id, response, exception):
+                if exception is not None:
+                    failed[request_id] = exception
+                elif verbose:
+                    tqdm.write(f"Deleted file: {files[request_id]}")
+
+            def delete_batch(file_ids: list[str]):
+                # Drive accepts at most 100 calls per batch request
+                service = self._svc()
+                for start in range(0, len(file_ids), 100):
+                    batch = service.new_batch_http_request(callback=callback)
+                    for file_id in file_ids[start:start + 100]:
+                        batch.add(service.files().delete(fileId=file_id, supportsAllDrives=True), request_id=file_id)
+                    batch.execute()
+
+            # Delete files in batches, then retry rate-limited and server errors with exponential backoff
+            delete_batch(list(files))
+            for attempt in range(5):
+                retry_ids = [file_id for file_id, e in failed.items() if self._is_retryable(e)]
+                if not retry_ids:
+                    break
+                time.sleep(2 ** attempt + random.random())
+                for file_id in retry_ids:
+                    del failed[file_id]
+                delete_batch(retry_ids)
+            for file_id, e in failed.items():
+                if verbose:
+                    tqdm.write(f"Error deleting file {files[file_id]}: {e}")
             
             if verbose:
                 tqdm.write(f"Successfully deleted all contents of folder {folder_id}")